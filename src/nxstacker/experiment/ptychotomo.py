@@ -323,7 +323,10 @@ class PtychoTomo(TomoExpt):
         self.include_angle as the value of rotation angle is available
         now. They will also be sorted if it is required.
         """
-        self._metadata = MetadataPtycho(self._projections, self._facility)
+        self._metadata = MetadataPtycho(
+            self._projections,
+            self._facility,
+        )
         self._metadata.fetch_metadata()
 
         # with rotation angles the projection files can be updated and
@@ -350,6 +353,9 @@ class PtychoTomo(TomoExpt):
         if self._include_angle:
             self._projections = self._filter_angle()
 
+        # the projection list may have changed
+        self._invalidate_nxtomo_file_prefix()
+
     def _filter_angle(self):
         filtered = deque()
         for pty_file in self._projections:
@@ -375,6 +381,7 @@ class PtychoTomo(TomoExpt):
         """
         if reverse:
             self._projections = self._projections[::-1]
+            self._invalidate_nxtomo_file_prefix()
 
         nxtomo_cplx, nxtomo_modl, nxtomo_phas = self._nxtomo_minimal()
 
@@ -513,8 +520,8 @@ class PtychoTomo(TomoExpt):
         if self._save_complex and all(
             pty_file.avail_complex for pty_file in self._projections
         ):
-            prefix = self._nxtomo_file_prefix()
-            f_cplx = self._nxtomo_dir / f"{prefix}_complex.nxs"
+            prefix = self._nxtomo_file_prefix
+            f_cplx = self.nxtomo_dir / f"{prefix}_complex.nxs"
             cplx_dtype = unique_or_raise(
                 [p.object_complex_dtype for p in self._projections],
                 companion=self._projections,
@@ -535,8 +542,8 @@ class PtychoTomo(TomoExpt):
         if self._save_modulus and all(
             pty_file.avail_modulus for pty_file in self._projections
         ):
-            prefix = self._nxtomo_file_prefix()
-            f_modl = self._nxtomo_dir / f"{prefix}_modulus.nxs"
+            prefix = self._nxtomo_file_prefix
+            f_modl = self.nxtomo_dir / f"{prefix}_modulus.nxs"
             modl_dtype = unique_or_raise(
                 [p.object_modulus_dtype for p in self._projections],
                 companion=self._projections,
@@ -557,8 +564,8 @@ class PtychoTomo(TomoExpt):
         if self._save_phase and all(
             pty_file.avail_phase for pty_file in self._projections
         ):
-            prefix = self._nxtomo_file_prefix()
-            f_phas = self._nxtomo_dir / f"{prefix}_phase.nxs"
+            prefix = self._nxtomo_file_prefix
+            f_phas = self.nxtomo_dir / f"{prefix}_phase.nxs"
             phas_dtype = unique_or_raise(
                 [p.object_phase_dtype for p in self._projections],
                 companion=self._projections,
@@ -7,7 +7,7 @@ This module provides:
 
 import re
 import time
-from contextlib import contextmanager, suppress
+from contextlib import contextmanager
 from functools import cached_property
 from itertools import chain
 from pathlib import Path
@@ -49,6 +49,7 @@ class TomoExpt:
     pad_to_max = FixedValue()
     compress = FixedValue()
     compression_settings = FixedValue()
+    chunk_shape = FixedValue()
     metadata = FixedValue()
     nxtomo_output_files = FixedValue()
     logger = FixedValue()
@@ -92,6 +93,10 @@ class TomoExpt:
         else:
             self.compression_settings = None
 
+        # None leaves the chunk shape to create_minimal, one chunk per
+        # projection frame
+        self.chunk_shape = None
+
         self.projections = []
         self.stack_shape = ()
 
@@ -113,11 +118,9 @@ class TomoExpt:
 
     def create_minimal_nxtomo(self, filename, stack_shape, stack_dtype):
         """Create a minimal NXtomo file."""
-        md_dict = self.metadata.to_dict()
-
-        # no need to pass rotation_angle
-        with suppress(KeyError):
-            md_dict.pop("rotation_angle")
+        # rotation_angle is not needed here, it is written when the
+        # projections are stacked
+        md_dict = self.metadata.to_dict_static()
 
         create_minimal(
             filename,
@@ -125,10 +128,12 @@ class TomoExpt:
             stack_dtype,
             self.facility,
             compression_settings=self.compression_settings,
+            chunks=self.chunk_shape,
             **md_dict,
         )
         return filename
 
+    @cached_property
     def _nxtomo_file_prefix(self):
         common = f"tomo_{self.short_name}"
 
@@ -151,6 +156,14 @@ class TomoExpt:
             )
         return prefix
 
+    def _invalidate_nxtomo_file_prefix(self):
+        """Drop the cached NXtomo file prefix.
+
+        It should be called whenever the metadata or the projection
+        list it is derived from has been changed.
+        """
+        self.__dict__.pop("_nxtomo_file_prefix", None)
+
     def _supported_extensions(self):
         return list(
             chain.from_iterable(
@@ -111,7 +111,10 @@ class XRFTomo(TomoExpt):
         self.include_angle as the value of rotation angle is available
         now. They will also be sorted if it is required.
         """
-        self._metadata = MetadataXRF(self._projections, self._facility)
+        self._metadata = MetadataXRF(
+            self._projections,
+            self._facility,
+        )
         self._metadata.fetch_metadata()
 
         # with rotation angles the projection files can be updated and
@@ -138,6 +141,9 @@ class XRFTomo(TomoExpt):
         if self._include_angle:
             self._projections = self._filter_angle()
 
+        # the projection list may have changed
+        self._invalidate_nxtomo_file_prefix()
+
     def _filter_angle(self):
         filtered = deque()
         for pty_file in self._projections:
@@ -160,6 +166,7 @@ class XRFTomo(TomoExpt):
         """
         if reverse:
             self._projections = self._projections[::-1]
+            self._invalidate_nxtomo_file_prefix()
 
         nxtomo_flist, stack_shapes = self._nxtomo_minimal()
 
@@ -190,8 +197,8 @@ class XRFTomo(TomoExpt):
         for t in self.transition:
             stack_shape, stack_dtype = self._decide_stack_attr(t)
 
-            prefix = self._nxtomo_file_prefix()
-            f_trans = self._nxtomo_dir / f"{prefix}_{t}.nxs"
+            prefix = self._nxtomo_file_prefix
+            f_trans = self.nxtomo_dir / f"{prefix}_{t}.nxs"
 
             nxtomo_fp = self.create_minimal_nxtomo(
                 f_trans,
@@ -7,6 +7,7 @@ from nxstacker.facility.facility import SPECS_DIR, FacilityInfo
 from nxstacker.utils.io import (
     dataset_from_first_valid_path,
     files_first_exist,
+    hdf5_handle,
 )
 from nxstacker.utils.parse import (
     as_dls_staging_area,
@@ -155,7 +156,7 @@ class I13_1(FacilityInfo):  # noqa: N801
 
         Parameters
         ----------
-        rot_f : str or pathlib.Path
+        rot_f : str, pathlib.Path or h5py.File
             the file from which the rotation angle is retrieved
         proj_file : ProjectionFile
             the projection file
@@ -174,27 +175,52 @@ class I13_1(FacilityInfo):  # noqa: N801
             raise ValueError(msg)
 
         num_projs = self._tot_num_proj(proj_file)
-        if int(proj_file.id_proj) >= num_projs:
-            pj = "projections" if num_projs > 1 else "projection"
-            msg = (
-                f"The projection number {proj_file.id_proj} is out of "
-                f"range for a scan with {num_projs} {pj}. The projection "
-                "number starts from 0."
-            )
-            raise IndexError(msg)
+        self._validate_id_proj(proj_file, num_projs)
 
-        with h5py.File(rot_f, "r") as f:
+        with hdf5_handle(rot_f) as f:
             dset = dataset_from_first_valid_path(f, self.rotation_angle_path)
             rot_ang = dset[int(proj_file.id_proj), :, 0].mean()
 
         return rot_ang
 
+    def rotation_angles(self, rot_f, proj_files):
+        """Retrieve rotation angles of projections sharing a file.
+
+        The pty_tomo file is opened once and the angle of every
+        projection is read from the same open file, instead of one
+        open/close cycle per projection.
+
+        Parameters
+        ----------
+        rot_f : str, pathlib.Path or h5py.File
+            the pty_tomo file from which the rotation angles are
+            retrieved
+        proj_files : list of ProjectionFile
+            the projection files associated with rot_f
+
+        Returns
+        -------
+        rot_angs : list of float
+            the rotation angles, in degree
+
+        """
+        with hdf5_handle(rot_f) as f:
+            num_projs = f["/data/frames"].shape[0]
+            dset = dataset_from_first_valid_path(f, self.rotation_angle_path)
+
+            rot_angs = []
+            for proj_file in proj_files:
+                self._validate_id_proj(proj_file, num_projs)
+                rot_angs.append(dset[int(proj_file.id_proj), :, 0].mean())
+
+        return rot_angs
+
     def sample_detector_dist(self, dist_f):
         """Retrieve the distance between the sample and detector.
 
         Parameters
         ----------
-        dist_f : str or pathlib.Path
+        dist_f : str, pathlib.Path or h5py.File
             the file from which the distance is retrieved
 
         Returns
@@ -203,12 +229,13 @@ class I13_1(FacilityInfo):  # noqa: N801
             the distance, in m
 
         """
-        with h5py.File(dist_f, "r") as f:
+        with hdf5_handle(dist_f) as f:
             dset = dataset_from_first_valid_path(
                 f, self.detector_distance_path
             )
             dist = dset[()]
-            if dist_f.suffix == ".nxs":
+            # f.filename also covers dist_f being an open handle
+            if Path(f.filename).suffix == ".nxs":
                 # assume .nxs recorded with mm
                 dist *= 1e-3
         return dist
@@ -221,6 +248,16 @@ class I13_1(FacilityInfo):  # noqa: N801
 
         return num_projs
 
+    def _validate_id_proj(self, proj_file, num_projs):
+        if int(proj_file.id_proj) >= num_projs:
+            pj = "projections" if num_projs > 1 else "projection"
+            msg = (
+                f"The projection number {proj_file.id_proj} is out of "
+                f"range for a scan with {num_projs} {pj}. The projection "
+                "number starts from 0."
+            )
+            raise IndexError(msg)
+
     def start_time(self, start_time_f, proj_file):
         """Get the start time.
 
@@ -233,7 +270,7 @@ class I13_1(FacilityInfo):  # noqa: N801
 
         Parameters
         ----------
-        start_time_f : pathlib.Path
+        start_time_f : pathlib.Path or h5py.File
             the file used to get the start time
         proj_file : ProjectionFile
             the ptychography projection file
@@ -245,16 +282,10 @@ class I13_1(FacilityInfo):  # noqa: N801
 
         """
         num_projs = self._tot_num_proj(proj_file)
-        if int(proj_file.id_proj) >= num_projs:
-            pj = "projections" if num_projs > 1 else "projection"
-            msg = (
-                f"The projection number {proj_file.id_proj} is out of "
-                f"range for a scan with {num_projs} {pj}. The projection "
-                "number starts from 0."
-            )
-            raise IndexError(msg)
+        self._validate_id_proj(proj_file, num_projs)
 
-        with h5py.File(start_time_f, "r") as f:
+        with hdf5_handle(start_time_f) as f:
+            time_path = Path(f.filename)
             dset = dataset_from_first_valid_path(f, self.start_time_path)
 
             size = dset.shape[0]
@@ -262,15 +293,7 @@ class I13_1(FacilityInfo):  # noqa: N801
             offset = int(proj_file.id_proj) * stride
             start_time = dset[offset, 0, 0]
 
-        # YY-MM-DD from file modification time
-        # hh-mm-ss from the timestamp
-        start_datetime = datetime.fromtimestamp(start_time, tz=timezone.utc)
-        file_mtime = datetime.fromtimestamp(
-            start_time_f.stat().st_mtime, tz=timezone.utc
-        )
-        start_time_tz = start_datetime.replace(
-            year=file_mtime.year, month=file_mtime.month, day=file_mtime.day
-        ).isoformat()
+        start_time_tz = self._timestamp_to_iso(start_time, time_path)
 
         return start_time_tz
 
@@ -286,7 +309,7 @@ class I13_1(FacilityInfo):  # noqa: N801
 
         Parameters
         ----------
-        end_time_f : pathlib.Path
+        end_time_f : pathlib.Path or h5py.File
             the file used to get the end time
         proj_file : ProjectionFile
             the ptychography projection file
@@ -298,16 +321,10 @@ class I13_1(FacilityInfo):  # noqa: N801
 
         """
         num_projs = self._tot_num_proj(proj_file)
-        if int(proj_file.id_proj) >= num_projs:
-            pj = "projections" if num_projs > 1 else "projection"
-            msg = (
-                f"The projection number {proj_file.id_proj} is out of "
-                f"range for a scan with {num_projs} {pj}. The projection "
-                "number starts from 0."
-            )
-            raise IndexError(msg)
+        self._validate_id_proj(proj_file, num_projs)
 
-        with h5py.File(end_time_f, "r") as f:
+        with hdf5_handle(end_time_f) as f:
+            time_path = Path(f.filename)
             dset = dataset_from_first_valid_path(f, self.end_time_path)
 
             size = dset.shape[0]
@@ -315,14 +332,59 @@ class I13_1(FacilityInfo):  # noqa: N801
             offset = (int(proj_file.id_proj) + 1) * stride - 1
             end_time = dset[offset, 0, 0]
 
+        end_time_tz = self._timestamp_to_iso(end_time, time_path)
+
+        return end_time_tz
+
+    def start_end_time(self, time_f, start_proj_file, end_proj_file):
+        """Get the start and end time in a single file open.
+
+        Both projections must belong to the scan of time_f. The same
+        date workaround as in start_time/end_time applies.
+
+        Parameters
+        ----------
+        time_f : pathlib.Path or h5py.File
+            the file used to get the start and end time
+        start_proj_file : ProjectionFile
+            the projection file providing the start time
+        end_proj_file : ProjectionFile
+            the projection file providing the end time
+
+        Returns
+        -------
+        start_time_tz, end_time_tz : str
+            the start and end time in ISO 8601 format with time zone
+
+        """
+        num_projs = self._tot_num_proj(start_proj_file)
+        self._validate_id_proj(start_proj_file, num_projs)
+        self._validate_id_proj(end_proj_file, num_projs)
+
+        with hdf5_handle(time_f) as f:
+            time_path = Path(f.filename)
+            dset = dataset_from_first_valid_path(f, self.start_time_path)
+            stride = dset.shape[0] // num_projs
+            offset = int(start_proj_file.id_proj) * stride
+            start_time = dset[offset, 0, 0]
+
+            dset = dataset_from_first_valid_path(f, self.end_time_path)
+            stride = dset.shape[0] // num_projs
+            offset = (int(end_proj_file.id_proj) + 1) * stride - 1
+            end_time = dset[offset, 0, 0]
+
+        start_time_tz = self._timestamp_to_iso(start_time, time_path)
+        end_time_tz = self._timestamp_to_iso(end_time, time_path)
+
+        return start_time_tz, end_time_tz
+
+    def _timestamp_to_iso(self, timestamp, time_f):
         # YY-MM-DD from file modification time
         # hh-mm-ss from the timestamp
-        end_datetime = datetime.fromtimestamp(end_time, tz=timezone.utc)
+        timestamp_dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
         file_mtime = datetime.fromtimestamp(
-            end_time_f.stat().st_mtime, tz=timezone.utc
+            time_f.stat().st_mtime, tz=timezone.utc
         )
-        end_time_tz = end_datetime.replace(
+        return timestamp_dt.replace(
             year=file_mtime.year, month=file_mtime.month, day=file_mtime.day
         ).isoformat()
-
-        return end_time_tz
@@ -1,12 +1,12 @@
 from pathlib import Path
 
-import h5py
 import numpy as np
 
 from nxstacker.facility.facility import SPECS_DIR, FacilityInfo
 from nxstacker.utils.io import (
     dataset_from_first_valid_path,
     files_first_exist,
+    hdf5_handle,
 )
 from nxstacker.utils.parse import (
     add_timezone,
@@ -83,7 +83,7 @@ class I14(FacilityInfo):
 
         Parameters
         ----------
-        rot_f : str or pathlib.Path
+        rot_f : str, pathlib.Path or h5py.File
             the file from which the rotation angle is retrieved
 
         Returns
@@ -92,18 +92,44 @@ class I14(FacilityInfo):
             the rotation angle, in degree
 
         """
-        with h5py.File(rot_f, "r") as f:
+        with hdf5_handle(rot_f) as f:
             dset = dataset_from_first_valid_path(f, self.rotation_angle_path)
             rot_ang = dset[()]
 
         return rot_ang
 
+    def rotation_angles(self, rot_f, proj_files):
+        """Retrieve rotation angles of projections sharing a file.
+
+        The file is opened once and, as every projection of a scan
+        shares the same NeXus file, the single angle it stores is used
+        for all of them.
+
+        Parameters
+        ----------
+        rot_f : str, pathlib.Path or h5py.File
+            the file from which the rotation angle is retrieved
+        proj_files : list of ProjectionFile
+            the projection files associated with rot_f
+
+        Returns
+        -------
+        rot_angs : list of float
+            the rotation angles, in degree
+
+        """
+        with hdf5_handle(rot_f) as f:
+            dset = dataset_from_first_valid_path(f, self.rotation_angle_path)
+            rot_ang = dset[()]
+
+        return [rot_ang] * len(proj_files)
+
     def sample_detector_dist(self, dist_f):
         """Retrieve the distance between the sample and detector.
 
         Parameters
         ----------
-        dist_f : str or pathlib.Path
+        dist_f : str, pathlib.Path or h5py.File
             the file from which the distance is retrieved
 
         Returns
@@ -112,7 +138,7 @@ class I14(FacilityInfo):
             the distance, in m
 
         """
-        with h5py.File(dist_f, "r") as f:
+        with hdf5_handle(dist_f) as f:
             dset = dataset_from_first_valid_path(
                 f, self.detector_distance_path
             )
@@ -125,7 +151,7 @@ class I14(FacilityInfo):
 
         Parameters
         ----------
-        px_f : str or pathlib.Path
+        px_f : str, pathlib.Path or h5py.File
             the file from which the x pixel size is retrieved
 
         Returns
@@ -134,7 +160,7 @@ class I14(FacilityInfo):
             the x pixel size, in m
 
         """
-        with h5py.File(px_f, "r") as f:
+        with hdf5_handle(px_f) as f:
             dset = dataset_from_first_valid_path(
                 f, self.sample_x_value_set_path
             )
@@ -149,7 +175,7 @@ class I14(FacilityInfo):
 
         Parameters
         ----------
-        px_f : str or pathlib.Path
+        px_f : str, pathlib.Path or h5py.File
             the file from which the y pixel size is retrieved
 
         Returns
@@ -158,7 +184,7 @@ class I14(FacilityInfo):
             the y pixel size, in m
 
         """
-        with h5py.File(px_f, "r") as f:
+        with hdf5_handle(px_f) as f:
             dset = dataset_from_first_valid_path(
                 f, self.sample_y_value_set_path
             )
@@ -176,7 +202,7 @@ class I14(FacilityInfo):
 
         Parameters
         ----------
-        start_time_f : str or pathlib.Path
+        start_time_f : str, pathlib.Path or h5py.File
             the file from which the start time is retrieved
 
         Returns
@@ -185,7 +211,7 @@ class I14(FacilityInfo):
             timestamp of the start time, in ISO 8601
 
         """
-        with h5py.File(start_time_f, "r") as f:
+        with hdf5_handle(start_time_f) as f:
             dset = dataset_from_first_valid_path(f, self.start_time_path)
             start_time = dset[()]
 
@@ -204,7 +230,7 @@ class I14(FacilityInfo):
 
         Parameters
         ----------
-        end_time_f : str or pathlib.Path
+        end_time_f : str, pathlib.Path or h5py.File
             the file from which the end time is retrieved
 
         Returns
@@ -213,7 +239,7 @@ class I14(FacilityInfo):
             timestamp of the end time, in ISO 8601
 
         """
-        with h5py.File(end_time_f, "r") as f:
+        with hdf5_handle(end_time_f) as f:
             dset = dataset_from_first_valid_path(f, self.end_time_path)
             end_time = dset[()]
 
@@ -223,3 +249,33 @@ class I14(FacilityInfo):
         end_time_tz = add_timezone(end_time)
 
         return end_time_tz
+
+    def start_end_time(self, time_f, *_):
+        """Retrieve the start and end time in a single file open.
+
+        The extra arguments are unused and act as placeholders so
+        there is a consistent interface across all FacilityInfo.
+
+        Parameters
+        ----------
+        time_f : str, pathlib.Path or h5py.File
+            the file from which both timestamps are retrieved
+
+        Returns
+        -------
+        start_time_tz, end_time_tz : str
+            timestamps of the start and end time, in ISO 8601
+
+        """
+        with hdf5_handle(time_f) as f:
+            dset = dataset_from_first_valid_path(f, self.start_time_path)
+            start_time = dset[()]
+            dset = dataset_from_first_valid_path(f, self.end_time_path)
+            end_time = dset[()]
+
+        if isinstance(start_time, bytes):
+            start_time = start_time.decode()
+        if isinstance(end_time, bytes):
+            end_time = end_time.decode()
+
+        return add_timezone(start_time), add_timezone(end_time)
@@ -1,17 +1,104 @@
+import functools
+import weakref
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import chain
+from types import MappingProxyType
 
+import h5py
 import numpy as np
 
+from nxstacker.utils.io import hdf5_handle
 from nxstacker.utils.model import ExperimentFacility, FixedValue
+from nxstacker.utils.resource import num_cpus
+
+
+def _close_handles(file_cache):
+    """Close every pooled HDF5 handle and empty the cache."""
+    for f in file_cache.values():
+        f.close()
+    file_cache.clear()
+
+
+def _proj_file_path(proj_file):
+    """Return the path of the projection file itself.
+
+    A finder in _FACILITY_FINDERS for the facilities which store
+    metadata in the projection file. Being a module-level function,
+    it stays picklable wherever it ends up being referenced.
+    """
+    return proj_file.file_path
 
 
 class NXtomoMetadata:
     """Hold metadata of a NXtomo file."""
 
+    __slots__ = (
+        "__weakref__",
+        "_dict_static",
+        "_dist_finders",
+        "_dist_is_constant",
+        "_end_time",
+        "_facility",
+        "_file_cache",
+        "_nxs_file",
+        "_position_file",
+        "_projections",
+        "_pty_tomo_file",
+        "_px_finder",
+        "_rot_finder",
+        "_rotation_angle",
+        "_start_time",
+        "_time_finder",
+        "detector_distance",
+        "is_scan_single",
+        "max_workers",
+        "sample_description",
+        "scan_end",
+        "scan_start",
+        "supplied_angles",
+        "title",
+        "x_pixel_size",
+        "y_pixel_size",
+    )
+
+    # per-facility configuration of the file finders used by the
+    # metadata methods, to be defined in the subclass. The values are
+    # attribute names of the cached finders, or callables used as-is.
+    _FACILITY_FINDERS = MappingProxyType({})
+
+    # whether the sample-detector distance is constant across a
+    # tomography scan, per facility, to be defined in the subclass.
+    # When it is, reading it from a single projection is enough and
+    # the per-projection reads are skipped.
+    _DIST_IS_CONSTANT = MappingProxyType({})
+
+    # chunk-cache parameters of the pooled handles. The metadata
+    # methods make many small reads from the same files so a large
+    # cache keeps what has been traversed resident.
+    _RDCC_NBYTES = 32 * 1024 * 1024
+    _RDCC_NSLOTS = 1_000_003
+
+    # instance state which cannot be pickled: the lru_cache wrappers
+    # around the facility methods, the resolved finders (bound
+    # methods) and the pool of open HDF5 handles. They are dropped by
+    # __getstate__ and rebuilt by __setstate__.
+    _TRANSIENT_SLOTS = (
+        "_dist_finders",
+        "_file_cache",
+        "_nxs_file",
+        "_position_file",
+        "_pty_tomo_file",
+        "_px_finder",
+        "_rot_finder",
+        "_time_finder",
+    )
+
     facility = ExperimentFacility()
     projections = FixedValue()
 
-    def __init__(self, projections, facility):
+    def __init__(self, projections, facility, supplied_angles=None):
         """Initialisse metadata of a NXtomo file.
 
         Parameters
@@ -23,22 +110,159 @@ class NXtomoMetadata:
             already contains the details, or a str, where an instance of
             FacilityInfo is initialised, or None, where the
             corresponding facility is deduced from given directories.
+        supplied_angles : iterable or None, optional
+            the rotation angles supplied by the caller, one per
+            projection and in the same order as 'projections'. When
+            given, find_rotation_angle returns them without reading
+            any file. Default to None, the angles are read from the
+            files.
 
         """
-        self.projections = list(projections)
-        self.facility = facility
+        # keep a reference when the caller already owns a list, as
+        # TomoExpt does, instead of copying the whole list
+        self.projections = (  # noqa: PLE0237
+            projections if isinstance(projections, list) else list(projections)
+        )
+        self.facility = facility  # noqa: PLE0237
+        if supplied_angles is None:
+            self.supplied_angles = None
+        else:
+            self.supplied_angles = tuple(supplied_angles)
+
+        # the number of threads used when fetching metadata from many
+        # files. The reads are I/O-bound so they overlap well.
+        self.max_workers = num_cpus()
+
+        self._init_path_caches()
 
         self.title = "title"
         self.sample_description = "sample description"
-        self.rotation_angle = np.arange(len(self.projections))
+        self.rotation_angle = None
         self.detector_distance = 1
         self.x_pixel_size = 1
         self.y_pixel_size = 1
-        self.start_time = datetime.now(timezone.utc).isoformat()
-        self.end_time = datetime.now(timezone.utc).isoformat()
+        self.start_time = None
+        self.end_time = None
+
+        # cache for the dictionary of static metadata, built on demand
+        self._dict_static = None
+
+        # pool of open HDF5 handles, keyed by file path. The finalizer
+        # closes whatever is left in case fetch_metadata is never
+        # called or does not run to completion.
+        self._file_cache = {}
+        weakref.finalize(self, _close_handles, self._file_cache)
 
         self.start_end_id_scan()
 
+    @property
+    def rotation_angle(self):
+        """Store the rotation angles of the projections.
+
+        The placeholder np.arange is only materialised when the angles
+        are accessed without having been set, as fetch_metadata
+        normally overwrites them straight away.
+        """
+        if self._rotation_angle is None:
+            self._rotation_angle = np.arange(len(self.projections))
+        return self._rotation_angle
+
+    @rotation_angle.setter
+    def rotation_angle(self, value):
+        self._rotation_angle = value
+
+    @property
+    def start_time(self):
+        """Store the start time, in ISO 8601.
+
+        The current time is only materialised when the start time is
+        accessed without having been set, as fetch_metadata normally
+        overwrites it straight away.
+        """
+        if self._start_time is None:
+            self._start_time = self._default_iso_time()
+        return self._start_time
+
+    @start_time.setter
+    def start_time(self, value):
+        self._start_time = value
+
+    @property
+    def end_time(self):
+        """Store the end time, in ISO 8601.
+
+        See start_time for the lazy default.
+        """
+        if self._end_time is None:
+            self._end_time = self._default_iso_time()
+        return self._end_time
+
+    @end_time.setter
+    def end_time(self, value):
+        self._end_time = value
+
+    @staticmethod
+    def _default_iso_time():
+        return datetime.now(timezone.utc).isoformat()
+
+    def _init_path_caches(self):
+        """Cache the file resolved for a projection.
+
+        Several metadata methods resolve the same projection
+        repeatedly, and the resolution stats the file system for
+        candidate paths, so the facility methods are wrapped with
+        lru_cache. The wrappers hold bound methods and cannot be
+        pickled, hence they are transient state rebuilt on unpickle.
+        """
+        self._nxs_file = functools.lru_cache(maxsize=None)(
+            self.facility.nxs_file
+        )
+        if hasattr(self.facility, "pty_tomo_file"):
+            self._pty_tomo_file = functools.lru_cache(maxsize=None)(
+                self.facility.pty_tomo_file
+            )
+        else:
+            self._pty_tomo_file = None
+        if hasattr(self.facility, "position_file"):
+            self._position_file = functools.lru_cache(maxsize=None)(
+                self.facility.position_file
+            )
+        else:
+            self._position_file = None
+
+    def __getstate__(self):
+        """Return the picklable state of the metadata.
+
+        The instance is sent to the worker processes when the stacking
+        is parallelised, so the transient state in _TRANSIENT_SLOTS is
+        excluded here and rebuilt in __setstate__.
+        """
+        slots = chain.from_iterable(
+            getattr(cls, "__slots__", ()) for cls in type(self).__mro__
+        )
+        return {
+            name: getattr(self, name)
+            for name in slots
+            if name != "__weakref__"
+            and name not in self._TRANSIENT_SLOTS
+            and hasattr(self, name)
+        }
+
+    def __setstate__(self, state):
+        """Restore the pickled state and rebuild the transient one."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        self._init_path_caches()
+
+        self._file_cache = {}
+        weakref.finalize(self, _close_handles, self._file_cache)
+
+        # the base class has no finder configured, only resolve them
+        # for the subclasses which did so at initialisation
+        if self.facility.name in self._FACILITY_FINDERS:
+            self._resolve_finders()
+
     def start_end_id_scan(self):
         """Determine the start and end scan ID.
 
@@ -56,37 +280,32 @@ class NXtomoMetadata:
         self.scan_start = start
         self.scan_end = end
 
-    def to_dict(self):
-        """Return the metadata as a dictionary."""
-        d = {
-            "title": self.title,
-            "sample_description": self.sample_description,
-            "rotation_angle": self.rotation_angle,
-            "detector_distance": self.detector_distance,
-            "x_pixel_size": self.x_pixel_size,
-            "y_pixel_size": self.y_pixel_size,
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-        }
-        return d
-
-
-class MetadataPtycho(NXtomoMetadata):
-    """Represent metadata for a ptycho-tomo experiment."""
-
-    def __init__(self, projections, facility):
-        """Initialise the ptychography metadata."""
-        super().__init__(projections, facility)
-
     def fetch_metadata(self):
         """Find the metadata of the current projections and facility."""
-        self.title = self.title_from_scan()
-        self.sample_description = self.description_from_scan()
-        self.rotation_angle = self.find_rotation_angle()
-        self.detector_distance = self.find_detector_dist()
-        self.x_pixel_size, self.y_pixel_size = self.find_pixel_size()
-        self.start_time = self.start_time_from_scan()
-        self.end_time = self.end_time_from_scan()
+        # the cached dictionary no longer reflects the metadata
+        self._dict_static = None
+
+        self._extract_projection_arrays()
+
+        try:
+            self.title = self.title_from_scan()
+            self.sample_description = self.description_from_scan()
+            self.rotation_angle = self.find_rotation_angle()
+            self.detector_distance = self.find_detector_dist()
+            self.x_pixel_size, self.y_pixel_size = self.find_pixel_size()
+            self.start_time, self.end_time = self.fetch_times()
+        finally:
+            # every file read happens above, release the pooled
+            # handles
+            self.close_files()
+
+    def _extract_projection_arrays(self):
+        """Extract per-projection scalar attributes in one pass.
+
+        The base implementation gathers nothing; a subclass overrides
+        this when its metadata methods work on columnar data instead
+        of walking the projection objects repeatedly.
+        """
 
     def title_from_scan(self):
         """Determine the tile from scan ID."""
@@ -106,45 +325,54 @@ class MetadataPtycho(NXtomoMetadata):
 
     def find_rotation_angle(self):
         """Find rotation angle."""
-        match self.facility.name:
-            case "i14":
-                file_finder = self.facility.nxs_file
-            case "i08-1":
-                file_finder = self.facility.nxs_file
-            case "i13-1":
-                file_finder = self.facility.pty_tomo_file
-            case _:
-                msg = f"Facility {self.facility.name} not supported"
+        if self.supplied_angles is not None:
+            # the caller supplied the angles, use them directly and
+            # skip reading them from the files entirely
+            if (num := len(self.supplied_angles)) != len(self.projections):
+                msg = (
+                    f"The number of supplied angles ({num}) does not "
+                    "match the number of projections "
+                    f"({len(self.projections)})."
+                )
                 raise ValueError(msg)
-
-        rotation_angles = np.empty_like(self.projections, dtype=float)
-        for k, p in enumerate(self.projections):
-            rot_f = file_finder(p)
-            rotation_angles[k] = self.facility.rotation_angle(rot_f, p)
+            return np.fromiter(
+                map(float, self.supplied_angles),
+                dtype=np.float64,
+                count=num,
+            )
+
+        groups = self._group_by_file(self._rot_finder)
+
+        def fetch(item):
+            rot_f, entries = item
+            # one open per group, closed by the reader straight away.
+            # Pooling here would hold one handle per unique file,
+            # which is unbounded when every projection has its own
+            # scan file.
+            return entries, self.facility.rotation_angles(
+                rot_f, [p for _, p in entries]
+            )
+
+        rotation_angles = np.empty(len(self.projections), dtype=np.float64)
+        max_workers = min(self.max_workers, len(groups))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for entries, angles in executor.map(fetch, groups.items()):
+                for (k, _), angle in zip(entries, angles, strict=True):
+                    rotation_angles[k] = angle
 
         return rotation_angles
 
     def find_detector_dist(self):
         """Find sample-detector distance."""
-        match self.facility.name:
-            case "i14":
-                file_finder = [self.facility.nxs_file]
-            case "i08-1":
-                # constant for i08-1
-                return self.facility.sample_detector_dist()
-            case "i13-1":
-                # there can be two places for the sample detector
-                # distance, the projection file itself or the .nxs
-                file_finder = [lambda x: x.file_path, self.facility.nxs_file]
-            case _:
-                msg = f"Facility {self.facility.name} not supported"
-                raise ValueError(msg)
+        if (file_finder := self._dist_finders) is None:
+            # the distance is a constant of the facility
+            return self.facility.sample_detector_dist()
 
-        # take the average from all metadata in the projections
-        total = 0
-        for p in self.projections:
+        def fetch(p, *, pooled=False):
             for finder in file_finder:
                 dist_f = finder(p)
+                if pooled:
+                    dist_f = self._pooled_file(dist_f)
 
                 try:
                     dist = self.facility.sample_detector_dist(dist_f)
@@ -152,193 +380,311 @@ class MetadataPtycho(NXtomoMetadata):
                     # the exception raised when trying to do None[...]
                     continue
                 else:
-                    total += dist
-                    break
-
-        distance = total / len(self.projections)
+                    return dist
+            return np.nan
+
+        if self._dist_is_constant:
+            # the distance does not change within a tomography scan,
+            # read it from the first projection only. The handle is
+            # pooled as the file is shared with the other methods.
+            dist = fetch(self.projections[0], pooled=True)
+            if not np.isnan(dist):
+                return float(dist)
+            # nothing recorded for the first projection, fall back to
+            # averaging over all of them
+
+        # take the average from all valid metadata in the projections.
+        # The handles are not pooled here as every projection can
+        # resolve to its own file, which would keep an unbounded
+        # number of them open at once.
+        max_workers = min(self.max_workers, len(self.projections))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            dists = np.fromiter(
+                executor.map(fetch, self.projections),
+                dtype=np.float64,
+                count=len(self.projections),
+            )
+
+        valid = dists[~np.isnan(dists)]
+        distance = float(valid.mean()) if valid.size else 0.0
         return distance
 
     def find_pixel_size(self):
-        """Find pixel size."""
-        # for ptychography, the pixel size is the real-space dimension
-        # in the reconstruction, and this should be retrieved from the
-        # projection file
-        total = 0
-        for p in self.projections:
-            total += p.pixel_size
-        pixel_size = total / len(self.projections)
+        """To be implemented in the subclass."""
+        raise NotImplementedError
 
-        return pixel_size, pixel_size
+    def fetch_times(self):
+        """Find the start and end time.
 
-    def start_time_from_scan(self):
-        """Find start time."""
-        match self.facility.name:
-            case "i14":
-                file_finder = self.facility.nxs_file
-            case "i08-1":
-                file_finder = self.facility.nxs_file
-            case "i13-1":
-                file_finder = self.facility.position_file
-            case _:
-                msg = f"Facility {self.facility.name} not supported"
-                raise ValueError(msg)
+        The start time comes from the first projection and the end time
+        from the last. When both resolve to the same file, it is opened
+        once and the two timestamps are read in one go.
 
-        # take the start time of the first scan in the projections
-        start_proj = self.projections[0]
+        Returns
+        -------
+        start_time, end_time : str
+            timestamps of the start and end time, in ISO 8601
 
-        start_time_f = file_finder(start_proj)
-        start_time = self.facility.start_time(start_time_f, start_proj)
-
-        return start_time
-
-    def end_time_from_scan(self):
-        """Find end time."""
-        match self.facility.name:
-            case "i14":
-                file_finder = self.facility.nxs_file
-            case "i08-1":
-                file_finder = self.facility.nxs_file
-            case "i13-1":
-                file_finder = self.facility.position_file
-            case _:
-                msg = f"Facility {self.facility.name} not supported"
-                raise ValueError(msg)
-
-        # take the end time of the last scan in the projections
+        """
+        start_proj = self.projections[0]
         end_proj = self.projections[-1]
 
-        end_time_f = file_finder(end_proj)
-        end_time = self.facility.end_time(end_time_f, end_proj)
+        start_time_f = self._time_finder(start_proj)
+        end_time_f = self._time_finder(end_proj)
 
-        return end_time
+        if start_time_f == end_time_f:
+            return self.facility.start_end_time(
+                self._pooled_file(start_time_f), start_proj, end_proj
+            )
 
+        start_time = self.facility.start_time(
+            self._pooled_file(start_time_f), start_proj
+        )
+        end_time = self.facility.end_time(
+            self._pooled_file(end_time_f), end_proj
+        )
 
-class MetadataXRF(NXtomoMetadata):
-    """Represent metadata for a XRF-tomo experiment."""
+        return start_time, end_time
 
-    def __init__(self, projections, facility):
-        """Initialise the XRF metadata."""
-        super().__init__(projections, facility)
+    def _resolve_finders(self):
+        """Resolve the facility-specific file finders once.
 
-    def fetch_metadata(self):
-        """Find the metadata of the current projections and facility."""
-        self.title = self.title_from_scan()
-        self.sample_description = self.description_from_scan()
-        self.rotation_angle = self.find_rotation_angle()
-        self.detector_distance = self.find_detector_dist()
-        self.x_pixel_size, self.y_pixel_size = self.find_pixel_size()
-        self.start_time = self.start_time_from_scan()
-        self.end_time = self.end_time_from_scan()
+        The metadata methods use the resolved finders directly instead
+        of re-dispatching on the facility name at every call.
 
-    def title_from_scan(self):
-        """Determine the tile from scan ID."""
-        if self.is_scan_single:
-            return f"{self.scan_start}"
-        return f"{self.scan_start}-{self.scan_end}"
+        """
+        try:
+            cfg = self._FACILITY_FINDERS[self.facility.name]
+        except KeyError:
+            msg = f"Facility {self.facility.name} not supported"
+            raise ValueError(msg) from None
+
+        self._rot_finder = getattr(self, cfg["rot"])
+        self._time_finder = getattr(self, cfg["time"])
+
+        if (dist := cfg["dist"]) is None:
+            # the distance is a facility constant, no file is read
+            self._dist_finders = None
+        else:
+            self._dist_finders = [
+                getattr(self, f) if isinstance(f, str) else f for f in dist
+            ]
+        self._dist_is_constant = self._DIST_IS_CONSTANT.get(
+            self.facility.name, False
+        )
+
+        if (px := cfg.get("px")) is not None:
+            self._px_finder = getattr(self, px)
+        else:
+            self._px_finder = None
 
-    def description_from_scan(self):
-        """Determine the description of the sample from projection."""
-        if descr := self.projections[0].description:
-            # all should have the same description, take the first
-            return descr
+    def _group_by_file(self, file_finder):
+        """Group projections by the file resolved from a finder.
 
-        raw_dir = self.projections[0].raw_dir
+        Many projections can share the same file, and grouping them
+        allows the file to be opened once for all of them instead of
+        once per projection.
 
-        return f"Tomography experiment at {raw_dir} with {self.title}"
+        Parameters
+        ----------
+        file_finder : callable
+            the callable resolving a projection to its file
 
-    def find_rotation_angle(self):
-        """Find rotation angle."""
-        match self.facility.name:
-            case "i14":
-                file_finder = self.facility.nxs_file
-            case _:
-                msg = f"Facility {self.facility.name} not supported"
-                raise ValueError(msg)
+        Returns
+        -------
+        groups : dict
+            a dictionary mapping the resolved file to a list of
+            (index, projection) tuples
 
-        rotation_angles = np.empty_like(self.projections, dtype=float)
+        """
+        groups = defaultdict(list)
         for k, p in enumerate(self.projections):
-            rot_f = file_finder(p)
-            rotation_angles[k] = self.facility.rotation_angle(rot_f, p)
+            groups[file_finder(p)].append((k, p))
+        return groups
 
-        return rotation_angles
+    def _pooled_file(self, fp):
+        """Return a pooled read-only handle of an HDF5 file.
 
-    def find_detector_dist(self):
-        """Find sample-detector distance."""
-        match self.facility.name:
-            case "i14":
-                file_finder = [self.facility.nxs_file]
-            case _:
-                msg = f"Facility {self.facility.name} not supported"
-                raise ValueError(msg)
+        The same file can be read by several metadata methods, and
+        keeping the handle open between them avoids repeating the
+        HDF5 metadata traversal of an open for every read. Only the
+        files of the first and last projections are pooled, used by
+        find_detector_dist and fetch_times, so the pool stays bounded
+        regardless of the number of projections. The setdefault
+        registration is atomic so the pool can be filled from the
+        worker threads.
 
-        # take the average from all metadata in the projections
-        total = 0
-        for p in self.projections:
-            for finder in file_finder:
-                dist_f = finder(p)
+        Parameters
+        ----------
+        fp : str or pathlib.Path
+            the path of the HDF5 file
 
-                try:
-                    dist = self.facility.sample_detector_dist(dist_f)
-                except TypeError:
-                    # the exception raised when trying to do None[...]
-                    continue
-                else:
-                    total += dist
-                    break
+        Returns
+        -------
+        f : h5py.File
+            the pooled open file
 
-        distance = total / len(self.projections)
-        return distance
+        """
+        if (f := self._file_cache.get(fp)) is not None:
+            return f
+
+        f = h5py.File(
+            fp,
+            "r",
+            rdcc_nbytes=self._RDCC_NBYTES,
+            rdcc_nslots=self._RDCC_NSLOTS,
+        )
+        cached = self._file_cache.setdefault(fp, f)
+        if cached is not f:
+            # another thread registered the file first
+            f.close()
+        return cached
+
+    def close_files(self):
+        """Close the pooled HDF5 handles."""
+        _close_handles(self._file_cache)
+
+    def to_dict_static(self):
+        """Return the metadata as a dictionary, without rotation angle.
+
+        The dictionary is cached as it can be requested once per NXtomo
+        output file, and fetch_metadata invalidates the cache.
+        """
+        if self._dict_static is None:
+            self._dict_static = {
+                "title": self.title,
+                "sample_description": self.sample_description,
+                "detector_distance": self.detector_distance,
+                "x_pixel_size": self.x_pixel_size,
+                "y_pixel_size": self.y_pixel_size,
+                "start_time": self.start_time,
+                "end_time": self.end_time,
+            }
+        return self._dict_static
+
+    def to_dict(self):
+        """Return the metadata as a dictionary."""
+        return self.to_dict_static() | {
+            "rotation_angle": self.rotation_angle,
+        }
+
+
+class MetadataPtycho(NXtomoMetadata):
+    """Represent metadata for a ptycho-tomo experiment."""
+
+    __slots__ = ("pixel_sizes",)
+
+    _DIST_IS_CONSTANT = MappingProxyType(
+        {
+            "i14": True,
+            "i08-1": True,
+            "i13-1": True,
+        }
+    )
+
+    _FACILITY_FINDERS = MappingProxyType(
+        {
+            "i14": {
+                "rot": "_nxs_file",
+                "time": "_nxs_file",
+                "dist": ("_nxs_file",),
+            },
+            "i08-1": {
+                "rot": "_nxs_file",
+                "time": "_nxs_file",
+                # constant for i08-1
+                "dist": None,
+            },
+            "i13-1": {
+                "rot": "_pty_tomo_file",
+                "time": "_position_file",
+                # there can be two places for the sample detector
+                # distance, the projection file itself or the .nxs
+                "dist": (_proj_file_path, "_nxs_file"),
+            },
+        }
+    )
+
+    def __init__(self, projections, facility, supplied_angles=None):
+        """Initialise the ptychography metadata."""
+        super().__init__(projections, facility, supplied_angles)
+
+        self._resolve_finders()
+
+    def _extract_projection_arrays(self):
+        """Extract per-projection scalar attributes in one pass.
+
+        The scalar attributes of the projection files are gathered
+        into NumPy arrays once, so the metadata methods work on the
+        columnar data instead of each walking the projection objects
+        again.
+        """
+        # for ptychography, the pixel size is the real-space dimension
+        # in the reconstruction, retrieved from the projection file.
+        # Keep the individual sizes around so callers can inspect the
+        # spread without re-reading the projections.
+        self.pixel_sizes = np.fromiter(
+            (p.pixel_size for p in self.projections),
+            dtype=np.float64,
+            count=len(self.projections),
+        )
 
     def find_pixel_size(self):
         """Find pixel size."""
-        match self.facility.name:
-            case "i14":
-                file_finder = self.facility.nxs_file
-            case _:
-                msg = f"Facility {self.facility.name} not supported"
-                raise ValueError(msg)
+        pixel_size = float(self.pixel_sizes.mean())
 
-        x_px_total, y_px_total = 0, 0
-        for p in self.projections:
-            px_f = file_finder(p)
-            x_px_total += self.facility.x_pixel_size(px_f)
-            y_px_total += self.facility.y_pixel_size(px_f)
+        return pixel_size, pixel_size
 
-        x_pixel_size = x_px_total / len(self.projections)
-        y_pixel_size = y_px_total / len(self.projections)
 
-        return x_pixel_size, y_pixel_size
+class MetadataXRF(NXtomoMetadata):
+    """Represent metadata for a XRF-tomo experiment."""
 
-    def start_time_from_scan(self):
-        """Find start time."""
-        match self.facility.name:
-            case "i14":
-                file_finder = self.facility.nxs_file
-            case _:
-                msg = f"Facility {self.facility.name} not supported"
-                raise ValueError(msg)
+    __slots__ = ()
 
-        # take the start time of the first scan in the projections
-        start_proj = self.projections[0]
+    _DIST_IS_CONSTANT = MappingProxyType(
+        {
+            "i14": True,
+        }
+    )
+
+    _FACILITY_FINDERS = MappingProxyType(
+        {
+            "i14": {
+                "rot": "_nxs_file",
+                "time": "_nxs_file",
+                "dist": ("_nxs_file",),
+                "px": "_nxs_file",
+            },
+        }
+    )
+
+    def __init__(self, projections, facility, supplied_angles=None):
+        """Initialise the XRF metadata."""
+        super().__init__(projections, facility, supplied_angles)
 
-        start_time_f = file_finder(start_proj)
-        start_time = self.facility.start_time(start_time_f, start_proj)
+        self._resolve_finders()
 
-        return start_time
+    def find_pixel_size(self):
+        """Find pixel size."""
 
-    def end_time_from_scan(self):
-        """Find end time."""
-        match self.facility.name:
-            case "i14":
-                file_finder = self.facility.nxs_file
-            case _:
-                msg = f"Facility {self.facility.name} not supported"
-                raise ValueError(msg)
+        def fetch(p):
+            # a single open serves both reads. The handle is not
+            # pooled as every projection can resolve to its own file,
+            # which would keep an unbounded number of them open.
+            with hdf5_handle(self._px_finder(p)) as f:
+                return (
+                    self.facility.x_pixel_size(f),
+                    self.facility.y_pixel_size(f),
+                )
 
-        # take the end time of the last scan in the projections
-        end_proj = self.projections[-1]
+        x_px_total, y_px_total = 0, 0
+        max_workers = min(self.max_workers, len(self.projections))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for x_px, y_px in executor.map(fetch, self.projections):
+                x_px_total += x_px
+                y_px_total += y_px
 
-        end_time_f = file_finder(end_proj)
-        end_time = self.facility.end_time(end_time_f, end_proj)
+        x_pixel_size = x_px_total / len(self.projections)
+        y_pixel_size = y_px_total / len(self.projections)
 
-        return end_time
+        return x_pixel_size, y_pixel_size
@@ -55,6 +55,7 @@ def create_minimal(
     facility,
     *,
     compression_settings=None,
+    chunks=None,
     title=None,
     sample_description=None,
     detector_distance=None,
@@ -78,6 +79,10 @@ def create_minimal(
     compression_settings : CompressionBlosc or None, optional
         the instance hodling attributes for Blosc compression. Default
         to None, no compression is applied.
+    chunks : tuple, optional
+        the chunk shape of the projection dataset. Default to None,
+        one chunk per projection frame, which matches the
+        frame-by-frame write pattern when stacking.
     title : str, optional
         title of the file. Default to None, skip saving it.
     sample_description : str, optional
@@ -112,6 +117,7 @@ def create_minimal(
             y_pixel_size=y_pixel_size,
             detector_distance=detector_distance,
             compression_settings=compression_settings,
+            chunks=chunks,
         )
 
         _create_sample(f, nframe, sample_description=sample_description)
@@ -168,6 +174,7 @@ def _create_detector(
     detector_distance=None,
     *,
     compression_settings=None,
+    chunks=None,
 ):
     grp_detector = root.create_group(str(NX_DETECTOR))
     grp_detector.attrs["NX_class"] = "NXdetector"
@@ -180,7 +187,11 @@ def _create_detector(
         # with compression
         compression = compression_settings.compression_id
         compression_opts = compression_settings.comopts
-    chunks = (1, stack_shape[1], stack_shape[2])
+
+    if chunks is None:
+        # one chunk per frame, contiguous for the frame-by-frame
+        # writes when stacking
+        chunks = (1, stack_shape[1], stack_shape[2])
 
     grp_detector.create_dataset(
         DATA_DETECTOR,
@@ -189,6 +200,7 @@ def _create_detector(
         chunks=chunks,
         compression=compression,
         compression_opts=compression_opts,
+        track_times=False,
     )
 
     grp_detector[IMAGE_KEY] = np.zeros(stack_shape[0], dtype=int)
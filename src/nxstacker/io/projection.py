@@ -13,6 +13,18 @@ from nxstacker.utils.parse import quote_iterable
 class ProjectionFile:
     """Act as the base class of projection file."""
 
+    __slots__ = (
+        "_description",
+        "_distance",
+        "_file_path",
+        "_id_angle",
+        "_id_proj",
+        "_id_scan",
+        "_pixel_size",
+        "_raw_dir",
+        "_trim_proj",
+    )
+
     experiment = "unknown"
     software = "unknown"
     path_names = MappingProxyType({})
@@ -55,7 +67,7 @@ class ProjectionFile:
             reconstruction. Default to None.
 
         """
-        self.file_path = file_path
+        self.file_path = file_path  # noqa: PLE0237
 
         if verify and not self.verify_file():
             paths = quote_iterable(self.essential_paths)
@@ -67,17 +79,17 @@ class ProjectionFile:
             raise KeyError(msg)
 
         # these needs to be overwritten later
-        self.id_scan = None
-        self.id_proj = None
+        self.id_scan = None  # noqa: PLE0237
+        self.id_proj = None  # noqa: PLE0237
 
         # the rotation angle is not known at this stage
         # this is available from the raw data file and retrieval of it
         # depends on the facility
-        self.id_angle = None
+        self.id_angle = None  # noqa: PLE0237
 
-        self.raw_dir = raw_dir
-        self.description = description
-        self.trim_proj = True
+        self.raw_dir = raw_dir  # noqa: PLE0237
+        self.description = description  # noqa: PLE0237
+        self.trim_proj = True  # noqa: PLE0237
 
     def verify_file(self):
         """Check existence of some essential hdf5 paths."""
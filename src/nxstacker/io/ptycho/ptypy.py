@@ -16,6 +16,24 @@ from nxstacker.utils.model import (
 class PtyPyFile(ProjectionFile):
     """Represent a PtyPy reconstruction file."""
 
+    __slots__ = (
+        "_object_complex_dtype",
+        "_object_modulus_dtype",
+        "_object_path",
+        "_object_phase_dtype",
+        "_object_shape",
+        "_probe_complex_dtype",
+        "_probe_modulus_dtype",
+        "_probe_path",
+        "_probe_phase_dtype",
+        "_probe_shape",
+        "_px_sz_path",
+        "_raw_file",
+        "_raw_file_path",
+        "_scan_name",
+        "_storage_name",
+    )
+
     experiment = "ptychography"
     software = "PtyPy"
     path_names = MappingProxyType(
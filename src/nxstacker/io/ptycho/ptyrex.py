@@ -15,6 +15,17 @@ from nxstacker.utils.model import (
 class PtyREXFile(ProjectionFile):
     """Represent a PtyREX reconstruction file."""
 
+    __slots__ = (
+        "_object_complex_dtype",
+        "_object_modulus_dtype",
+        "_object_phase_dtype",
+        "_object_shape",
+        "_probe_complex_dtype",
+        "_probe_modulus_dtype",
+        "_probe_phase_dtype",
+        "_probe_shape",
+    )
+
     experiment = "ptychography"
     software = "PtyREX"
     path_names = MappingProxyType(
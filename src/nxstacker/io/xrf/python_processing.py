@@ -10,6 +10,8 @@ from nxstacker.utils.io import is_staging_area, top_level_dir
 class XRFWindowFile(ProjectionFile):
     """Represent a XRF window file from Python processing."""
 
+    __slots__ = ()
+
     experiment = "xrf"
     software = "python processing"
     path_names = MappingProxyType(
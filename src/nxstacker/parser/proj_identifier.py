@@ -6,7 +6,7 @@ from pathlib import Path
 import numpy as np
 
 
-def generate_numbers(specifier, dtype=int):
+def generate_numbers(specifier, dtype=int, *, as_str=False):
     """Generate a list of numbers from specifier.
 
     The specifier should have the format of <START>[-<END>[:<STEP>]], for
@@ -18,6 +18,10 @@ def generate_numbers(specifier, dtype=int):
         the specifier for the generation of number
     dtype : type, optional
         the data type of the numbers. Default to int.
+    as_str : bool, optional
+        whether to return the numbers as str directly, saving the
+        caller from rebuilding the list with a second conversion pass.
+        Default to False.
 
     """
     result = []
@@ -55,7 +59,8 @@ def generate_numbers(specifier, dtype=int):
             )
             raise ValueError(msg)
 
-        result.extend(list(np.arange(start, end + eps, step).astype(dtype)))
+        numbers = np.arange(start, end + eps, step).astype(dtype)
+        result.extend(map(str, numbers) if as_str else numbers)
 
     return result
 
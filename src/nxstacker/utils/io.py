@@ -1,5 +1,6 @@
 import re
 import subprocess
+from contextlib import contextmanager
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
@@ -32,6 +33,35 @@ def file_has_paths(file_path, paths):
         return all(path in f for path in paths)
 
 
+@contextmanager
+def hdf5_handle(fp, **kwargs):
+    """Yield an h5py.File open for reading.
+
+    When fp is an already-open h5py.File, it is yielded as-is and left
+    open afterwards, so a caller managing a pool of handles can pass
+    them to readers which otherwise open the file themselves.
+
+    Parameters
+    ----------
+    fp : str, pathlib.Path or h5py.File
+        the HDF5 file, either as a path or an open handle
+    **kwargs : dict, optional
+        additional keyword arguments passed to h5py.File when fp is a
+        path
+
+    Yields
+    ------
+    f : h5py.File
+        the open file
+
+    """
+    if isinstance(fp, h5py.File):
+        yield fp
+    else:
+        with h5py.File(fp, "r", **kwargs) as f:
+            yield f
+
+
 def top_level_dir(directory, depth=6):
     """Return partial path of a directory with a specific depth.
 
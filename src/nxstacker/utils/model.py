@@ -105,15 +105,28 @@ class Directory(FixedValue):
         self.undefined_ok = undefined_ok
         self.must_exist = must_exist
 
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        dir_ = getattr(instance, self.private_name)
+        if dir_ is None and not self.undefined_ok:
+            # the current-directory default is only materialised when
+            # the attribute is actually consumed
+            return Path()
+        return dir_
+
     def __set__(self, instance, value):
         if hasattr(instance, self.private_name):
             msg = f"can't set attribute '{self.public_name}'"
             raise AttributeError(msg)
 
-        if value is None and self.undefined_ok:
+        if value is None:
+            # store the sentinel, __get__ falls back to the current
+            # directory when the attribute cannot be undefined. The
+            # current directory always exists so no validation is
+            # needed.
             dir_ = None
-        elif value is None:
-            dir_ = Path()
         else:
             if isinstance(value, bytes):
                 value = value.decode()
@@ -222,13 +235,18 @@ class IdentifierRange(FixedValue):
             raise AttributeError(msg)
 
         if value is None:
-            id_rng = ()
+            id_rng_as_str = ()
         elif isinstance(value, str):
-            id_rng = generate_numbers(value, dtype=self.num_type)
+            # generate the str directly to avoid rebuilding the range
+            # with a second conversion pass
+            id_rng_as_str = tuple(
+                generate_numbers(value, dtype=self.num_type, as_str=True)
+            )
         else:
-            id_rng = tuple(value)
+            # map avoids the per-iteration name binding of a
+            # comprehension, and str() on existing str is a no-op
+            id_rng_as_str = tuple(map(str, value))
 
-        id_rng_as_str = tuple(str(k) for k in id_rng)
         setattr(instance, self.private_name, id_rng_as_str)
 
 
@@ -242,11 +260,13 @@ class ExperimentFacility(FixedValue):
 
         if value is None or isinstance(value, str):
             # these are all directories which can help deducing facility
-            # in case they are not defined
+            # in case they are not defined. The instance might use
+            # __slots__ and have no __dict__.
+            inst_dict = getattr(instance, "__dict__", {})
             associated_dir = [
-                instance.__dict__.get("_proj_dir"),
-                instance.__dict__.get("_nxtomo_dir"),
-                instance.__dict__.get("_raw_dir"),
+                inst_dict.get("_proj_dir"),
+                inst_dict.get("_nxtomo_dir"),
+                inst_dict.get("_raw_dir"),
             ]
 
             facility = choose_facility_info(value, dirs=associated_dir)
@@ -168,3 +168,76 @@ def test_ptycho_i08_1_from_scan_list(
 
     with h5py.File(nxtomo_phas, "r") as f:
         assert f["/entry/data/data"].dtype == np.float32
+
+
+def test_ptycho_i08_1_parallel_stack(
+    tmp_path,
+    rotation_angle,
+    sample_x_value_set,
+    sample_y_value_set,
+    x_px_size,
+    y_px_size,
+):
+    # 56 scans, above the 50-projection threshold so the stacking is
+    # parallelised and the experiment instance crosses the process
+    # boundary
+    start_scan = 32100
+    end_scan = 32155
+    num_scans = end_scan - start_scan + 1
+
+    prep_i08_1 = PrepareI08_1(
+        tmp_path,
+        start_scan,
+        end_scan,
+        rotation_angle=rotation_angle,
+        sample_x_value_set=sample_x_value_set,
+        sample_y_value_set=sample_y_value_set,
+    )
+    prep_i08_1.write_dummy_raw()
+
+    ptypy_prep = PreparePtyPyFile(
+        tmp_path,
+        scan_num=prep_i08_1.scan_num,
+        raw_files=prep_i08_1.raw_files,
+        ob_shape=(sample_y_value_set.size, sample_x_value_set.size),
+        x_px_size=x_px_size,
+        y_px_size=y_px_size,
+    )
+    ptypy_prep.write_dummy_proj()
+
+    proj_file = ptypy_prep.proj_dir / "scan_%(scan).ptyr"
+
+    nxtomo_files = tomojoin(
+        "ptychography",
+        proj_file=proj_file,
+        nxtomo_dir=str(tmp_path),
+        from_scan=f"{start_scan}-{end_scan}",
+        save_complex=True,
+        save_phase=False,
+        facility="i08-1",
+    )
+
+    assert len(nxtomo_files) == 1
+
+    with h5py.File(nxtomo_files[0], "r") as f:
+        data = f["/entry/data/data"][()]
+        rot_angs = f["/entry/data/rotation_angle"][()]
+
+    assert data.shape == (
+        num_scans,
+        sample_y_value_set.size,
+        sample_x_value_set.size,
+    )
+
+    # all the same for testing. An all-zero dataset, as left behind
+    # when the workers fail silently, does not pass here.
+    assert np.isclose(rot_angs, np.array([rotation_angle] * num_scans)).all()
+
+    # every written projection matches the first mode of the complex
+    # object in its reconstruction file, in scan order
+    ob_path = f"/content/obj/{ptypy_prep.storage}/data"
+    for k, fp in enumerate(ptypy_prep.proj_files):
+        with h5py.File(fp, "r") as f:
+            expected = f[ob_path][0, :, :]
+
+        assert np.array_equal(data[k], expected)
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from nxstacker.io.nxtomo.metadata import MetadataPtycho
+from nxstacker.io.ptycho.ptypy import PtyPyFile
+
+from .prepare_facility import PrepareI08_1
+from .prepare_proj_file import PreparePtyPyFile
+
+
+@pytest.fixture
+def rotation_angle():
+    return -31.8
+
+
+@pytest.fixture
+def projections(tmp_path, rotation_angle):
+    prep_i08_1 = PrepareI08_1(
+        tmp_path,
+        32145,
+        32151,
+        rotation_angle=rotation_angle,
+    )
+    prep_i08_1.write_dummy_raw()
+
+    ptypy_prep = PreparePtyPyFile(
+        tmp_path,
+        scan_num=prep_i08_1.scan_num,
+        raw_files=prep_i08_1.raw_files,
+        ob_shape=(21, 31),
+        x_px_size=3.21e-6,
+        y_px_size=3.21e-6,
+    )
+    ptypy_prep.write_dummy_proj()
+
+    proj_files = []
+    for fp in ptypy_prep.proj_files:
+        pty_file = PtyPyFile(fp, id_proj=0, verify=False)
+        pty_file.fill_attr()
+        proj_files.append(pty_file)
+    return proj_files
+
+
+def test_supplied_angles_skip_file_read(projections):
+    supplied = np.linspace(-90, 90, num=len(projections))
+
+    metadata = MetadataPtycho(projections, "i08-1", supplied_angles=supplied)
+    rot_angs = metadata.find_rotation_angle()
+
+    # the supplied angles are used as given, in order, not the angle
+    # recorded in the raw files
+    assert np.allclose(rot_angs, supplied)
+
+
+def test_supplied_angles_length_mismatch(projections):
+    supplied = np.linspace(-90, 90, num=len(projections) + 1)
+
+    metadata = MetadataPtycho(projections, "i08-1", supplied_angles=supplied)
+    with pytest.raises(ValueError, match="does not match"):
+        metadata.find_rotation_angle()
+
+
+def test_angles_from_file_by_default(projections, rotation_angle):
+    metadata = MetadataPtycho(projections, "i08-1")
+    rot_angs = metadata.find_rotation_angle()
+
+    assert np.allclose(rot_angs, [rotation_angle] * len(projections))